@@ -48,9 +48,10 @@ class TimeZoneField(CastOnAssignFieldMixin, BaseTimeZoneField):
     def get_default_pytz_tzs():
         """
         For timezone field v5+ this is how to override pytz defaults
-        Override to use all time zones instead of common by default
+        Override to use all time zones instead of common by default. The time zones are built once on the class
+        so every field instance doesn't look up all of them again.
         """
-        return [pytz.timezone(tz) for tz in pytz.all_timezones]
+        return list(TimeZoneField.default_tzs)
 
     @classmethod
     def get_all_choices(cls):
@@ -256,7 +256,7 @@ class RecurrenceForm(RRuleForm):
         rrule_model = self.cleaned_data.get('rrule')
         if rrule_model:
             # Refresh if the next occurrence is not expired.
-            need_to_refresh_next_occurrence = rrule_model.next_occurrence > datetime.utcnow()
+            need_to_refresh_next_occurrence = rrule_model.next_occurrence > RRule.get_current_time()
         else:
             # Use the recurrence passed into save kwargs
             rrule_model = kwargs.get('recurrence') or RRule()
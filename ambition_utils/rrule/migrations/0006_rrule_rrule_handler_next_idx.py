@@ -0,0 +1,17 @@
+# Generated by Django 3.2.20 on 2026-10-16 16:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rrule', '0005_auto_20230802_1548'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='rrule',
+            index=models.Index(fields=['occurrence_handler_path', 'next_occurrence'], name='rrule_handler_next_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 3.2.20 on 2026-10-16 16:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rrule', '0006_rrule_rrule_handler_next_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='rrule',
+            index=models.Index(
+                condition=models.Q(next_occurrence__isnull=False),
+                fields=['next_occurrence'],
+                name='rrule_due_idx',
+            ),
+        ),
+    ]
@@ -8,8 +8,11 @@ from django.db import models, transaction
 from django.utils.module_loading import import_string
 from fleming import fleming
 from manager_utils import bulk_update
+from pytz.tzinfo import StaticTzInfo
 from ambition_utils.fields import TimeZoneField
-from typing import List
+from functools import lru_cache
+from itertools import islice
+from typing import Iterator, List
 import copy
 import pytz
 import logging
@@ -17,16 +20,168 @@ import logging
 LOG = logging.getLogger(__name__)
 
 
+def _freeze(value):
+    """
+    Recursively converts rrule params to tuples so they can be hashed and used as a cache key
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+
+    return value
+
+
+def _parse_date(value):
+    """
+    Parses a date string from rrule params. Stored params are always in iso format, which datetime.fromisoformat
+    parses much faster than dateutil. Any other format falls back to dateutil's parser.
+    :param value: The date string to parse
+    :rtype: datetime
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return parser.parse(value)
+
+
+@lru_cache(maxsize=512)
+def _parse_rrule_params(params_key):
+    """
+    Parses the dates in a frozen set of rrule params. The parsed params are cached so identical params are only
+    parsed once. Only immutable values are cached, never dateutil objects, because dateutil's cached rules keep
+    iterator state that must not be shared.
+    :param params_key: The rrule params as returned by _freeze
+    :rtype: tuple
+    """
+    params = dict(params_key)
+
+    # Convert next scheduled from utc back to time zone
+    if params.get('dtstart') and not hasattr(params.get('dtstart'), 'date'):
+        params['dtstart'] = _parse_date(params['dtstart'])
+
+    # Convert until date from utc back to time zone
+    if params.get('until') and not hasattr(params.get('until'), 'date'):
+        params['until'] = _parse_date(params['until'])
+
+    return tuple(params.items())
+
+
+def _compile_rrule(params_key):
+    """
+    Builds a new rrule object from a frozen set of rrule params using the cached parsed params
+    :param params_key: The rrule params as returned by _freeze
+    :rtype: rrule
+    """
+    params = dict(_parse_rrule_params(params_key))
+
+    # Always cache
+    params['cache'] = True
+
+    # Return the rrule
+    return rrule(**params)
+
+
+def _compile_rrule_set(params_key, exclusion_params_key=None):
+    """
+    Builds a new rrule set from frozen rrule params and optional exclusion params. A new set is built for every
+    call because dateutil's cached sets hold iterator state and a lock that are not safe to share.
+    :param params_key: The rrule params as returned by _freeze
+    :param exclusion_params_key: The optional rrule exclusion params as returned by _freeze
+    :rtype: rruleset
+    """
+    rrule_set = rruleset(cache=True)
+    rrule_set.rrule(_compile_rrule(params_key))
+    if exclusion_params_key:
+        rrule_set.exrule(_compile_rrule(exclusion_params_key))
+
+    return rrule_set
+
+
+@lru_cache(maxsize=4096)
+def _localize_to_utc(time_zone, dt):
+    """
+    Treats a naive datetime as being in the time zone and converts it to a naive utc datetime. Rules that share a
+    time zone tend to share occurrence times, so conversions are cached.
+    :param time_zone: The pytz time zone of the datetime
+    :param dt: The naive datetime to convert
+    :rtype: datetime
+    """
+    return time_zone.localize(dt).astimezone(pytz.utc).replace(tzinfo=None)
+
+
+@lru_cache(maxsize=256)
+def _import_occurrence_handler_class(occurrence_handler_path):
+    """
+    Imports and caches an occurrence handler class so the path is only resolved once
+    :param occurrence_handler_path: The python path to the handler class
+    """
+    return import_string(occurrence_handler_path)
+
+
+# Larger requests are generated on every call so the cache can't hold hundreds of long date tuples
+_MAX_CACHED_NUM_DATES = 100
+
+
+@lru_cache(maxsize=512)
+def _get_dates_from_params(rrule_class, params_key, time_zone, num_dates, start_date, end_date):
+    """
+    Generates and caches the dates for a set of frozen rrule params. The dates only depend on the arguments so
+    identical calls can share the result.
+    :param rrule_class: The RRule model class used to generate the dates
+    :param params_key: The rrule params as returned by _freeze
+    :rtype: tuple
+    """
+    rule = rrule_class(rrule_params=dict(params_key), time_zone=time_zone)
+    return tuple(rule.get_dates(num_dates=num_dates, start_date=start_date, end_date=end_date))
+
+
 class RRuleManager(models.Manager):
     """
     Custom manager for rrule objects
     """
 
     def update_next_occurrences(self, rrule_objects=None):
+        """
+        Advances the next occurrence of each rrule and saves all of them in a single bulk update
+        :param rrule_objects: A list or queryset of rrules. A queryset will only load the fields needed to compute
+        the next occurrences unless it already uses only(), defer(), select_related() or prefetch_related() or has
+        already been evaluated, in which case it is used as given.
+        :return: The advanced rrules. A queryset is returned as a list of its rrules.
+        """
         if rrule_objects is None:
             return
+
+        if isinstance(rrule_objects, models.QuerySet):
+            # Narrowing the columns would replace the caller's deferred fields, conflicts with select_related, would
+            # load prefetched relations one rrule at a time and would discard the caller's evaluated instances
+            deferred_fields, _ = rrule_objects.query.deferred_loading
+            if (
+                not deferred_fields and
+                not rrule_objects.query.select_related and
+                not rrule_objects._prefetch_related_lookups and
+                rrule_objects._result_cache is None
+            ):
+                rrule_objects = rrule_objects.only(
+                    'id',
+                    'rrule_params',
+                    'rrule_exclusion_params',
+                    'time_zone',
+                    'last_occurrence',
+                    'next_occurrence',
+                    'day_offset',
+                )
+            rrule_objects = list(rrule_objects)
+
+        # Nothing to advance or save
+        if not rrule_objects:
+            return rrule_objects
+
+        # Check every rrule against the same current time
+        current_time = self.model.get_current_time()
         for rrule_object in rrule_objects:
-            rrule_object.update_next_occurrence(save=False)
+            rrule_object.update_next_occurrence(save=False, current_time=current_time)
 
         bulk_update(self, rrule_objects, ['last_occurrence', 'next_occurrence'])
 
@@ -56,12 +211,17 @@ class RRuleManager(models.Manager):
         # Bulk update the next occurrences
         RRule.objects.update_next_occurrences(rrule_objects=rrules)
 
+    @transaction.atomic
     def process_related_model_handlers(self):
-        # Get the rrule objects that are overdue and need to be handled
+        # Get the rrule objects that are overdue and need to be handled. Rows locked by another worker processing
+        # related model handlers are skipped instead of waited on, so concurrent workers never pass the same rrule to
+        # a related model handler. Occurrence handler paths take no locks.
         rrule_objects = self.get_queryset().filter(
-            next_occurrence__lte=datetime.utcnow(),
+            next_occurrence__lte=self.model.get_current_time(),
             related_object_handler_name__isnull=False,
             related_object_id__isnull=False,
+        ).select_for_update(
+            skip_locked=True
         ).prefetch_related('related_object')
 
         rrules_to_advance = []
@@ -83,12 +243,15 @@ class RRuleManager(models.Manager):
         Returns a set of instances for any handler with an old next_occurrence
         """
 
-        # Get the rrule objects that are overdue and need to be handled
+        # Get the rrule objects that are overdue and need to be handled. Only the handler path is needed from each.
         rrule_objects = self.get_queryset().filter(
-            next_occurrence__lte=datetime.utcnow(),
+            next_occurrence__lte=self.model.get_current_time(),
             **kwargs
         ).distinct(
             'occurrence_handler_path'
+        ).only(
+            'id',
+            'occurrence_handler_path',
         )
 
         # Return instances of the handler classes
@@ -141,6 +304,27 @@ class RRule(models.Model):
     # Custom object manager
     objects = RRuleManager()
 
+    class Meta:
+        indexes = [
+            # Overdue rrules are looked up by handler path and next occurrence
+            models.Index(fields=['occurrence_handler_path', 'next_occurrence'], name='rrule_handler_next_idx'),
+            # Only rrules that have not ended can be overdue, so ended rrules are left out of the index
+            models.Index(
+                fields=['next_occurrence'],
+                condition=models.Q(next_occurrence__isnull=False),
+                name='rrule_due_idx',
+            ),
+        ]
+
+    @classmethod
+    def get_current_time(cls):
+        """
+        Returns the current naive utc time used when checking and advancing occurrences. All current time lookups
+        go through this method so callers can patch a single place to control the time.
+        :rtype: datetime
+        """
+        return datetime.utcnow()
+
     def get_time_zone_object(self):
         """
         Returns the time zone object from pytz
@@ -154,6 +338,17 @@ class RRule(models.Model):
 
         return self.time_zone
 
+    def get_fixed_utc_offset(self):
+        """
+        Returns the utc offset of the time zone if it never changes, like utc, or None if the offset depends on the date
+        :rtype: timedelta
+        """
+        time_zone = self.get_time_zone_object()
+        if time_zone is pytz.utc or isinstance(time_zone, StaticTzInfo):
+            return time_zone.utcoffset(None)
+
+        return None
+
     def get_occurrence_handler_class_instance(self):
         """
         Gets an instance of the occurrence handler class associated with this rrule
@@ -161,7 +356,7 @@ class RRule(models.Model):
         :return: The instance
         """
         try:
-            handler_class = import_string(self.occurrence_handler_path)()
+            handler_class = _import_occurrence_handler_class(self.occurrence_handler_path)()
             return handler_class
         except:
             return None
@@ -170,12 +365,10 @@ class RRule(models.Model):
         """
         Returns the rrule set that will combine the rrule and optional exclusion rrule
         """
-        rrule_set = rruleset()
-        rrule_set.rrule(self.get_rrule())
-        rrule_exclusion = self.get_rrule_exclusion()
-        if rrule_exclusion:
-            rrule_set.exrule(rrule_exclusion)
-        return rrule_set
+        return _compile_rrule_set(
+            _freeze(self.rrule_params),
+            _freeze(self.rrule_exclusion_params) if self.rrule_exclusion_params else None
+        )
 
     def get_rrule(self):
         """
@@ -200,22 +393,8 @@ class RRule(models.Model):
         if not params:
             return None
 
-        # Create a deep copy because we will manipulate
-        params = copy.deepcopy(params)
-
-        # Convert next scheduled from utc back to time zone
-        if params.get('dtstart') and not hasattr(params.get('dtstart'), 'date'):
-            params['dtstart'] = parser.parse(params['dtstart'])
-
-        # Convert until date from utc back to time zone
-        if params.get('until') and not hasattr(params.get('until'), 'date'):
-            params['until'] = parser.parse(params['until'])
-
-        # Always cache
-        params['cache'] = True
-
-        # Return the rrule
-        return rrule(**params)
+        # Build the rrule. The params are frozen into the parse cache key so any change to them is parsed again
+        return _compile_rrule(_freeze(params))
 
     def get_next_occurrence(self, last_occurrence=None, calculate_offset=True, force=False):
         """
@@ -226,18 +405,24 @@ class RRule(models.Model):
         :rtype: rrule or None
         """
         # Get the last occurrence
-        last_occurrence = last_occurrence or self.last_occurrence or datetime.utcnow()
-
-        # Get the rule set
-        rule_set = self.get_rrule_set()
+        last_occurrence = last_occurrence or self.last_occurrence or self.get_current_time()
 
         # Convert to local time zone for getting next occurrence, otherwise time zones ahead of utc will return the same
-        last_occurrence = fleming.convert_to_tz(last_occurrence, self.get_time_zone_object(), return_naive=True)
+        last_occurrence = self.convert_from_utc(last_occurrence)
 
         # Un-offset the last occurrence to match the rule_set's dates for .after() before offsetting again later
         if calculate_offset:
             last_occurrence = self.offset(last_occurrence, reverse=True)
 
+        # The series has ended once the last occurrence reaches until. Skip building and walking the rule set.
+        if not force:
+            until = dict(_parse_rrule_params(_freeze(self.rrule_params))).get('until')
+            if until and last_occurrence >= until:
+                return None
+
+        # Get the rule set
+        rule_set = self.get_rrule_set()
+
         # Generate the next occurrence
         next_occurrence = rule_set.after(last_occurrence)
 
@@ -270,7 +455,7 @@ class RRule(models.Model):
         # Return the next occurrence
         return next_occurrence
 
-    def update_next_occurrence(self, save=True):
+    def update_next_occurrence(self, save=True, current_time=None):
         """
         Sets the next_occurrence property to the next time in the series and sets the last_occurrence property
         to the previous value of next_occurrence. If the save option is True, the model will be saved. The
@@ -278,12 +463,16 @@ class RRule(models.Model):
         of many models.
         :param save: Flag to save the model after updating the schedule.
         :type save: bool
+        :param current_time: Optional datetime object to check the next occurrence against. Defaults to the current
+        time.
+        :return: None if the series has ended or False if the next occurrence is not due. Neither case builds the rrule
+        or saves the model.
         """
         if not self.next_occurrence:
             return None
 
         # Only handle if the current date is >= next occurrence
-        if datetime.utcnow() < self.next_occurrence:
+        if (current_time or self.get_current_time()) < self.next_occurrence:
             return False
 
         self.last_occurrence = self.next_occurrence
@@ -294,18 +483,78 @@ class RRule(models.Model):
         if save:
             self.save(update_fields=['last_occurrence', 'next_occurrence'])
 
+    def advance_to(self, save=True, current_time=None):
+        """
+        Advances past every occurrence up to the current time in one step instead of handling each missed occurrence
+        separately. The last occurrence becomes the most recent missed occurrence and the next occurrence becomes the
+        first occurrence after the current time.
+        :param save: Flag to save the model after advancing. The model is saved once no matter how many occurrences
+        were skipped.
+        :type save: bool
+        :param current_time: Optional datetime object to advance to. Defaults to the current time.
+        :return: None if the series has ended or False if the next occurrence is not due. Neither case saves the model.
+        """
+        if not self.next_occurrence:
+            return None
+
+        # Only advance if the current date is >= next occurrence
+        current_time = current_time or self.get_current_time()
+        if current_time < self.next_occurrence:
+            return False
+
+        # The most recent occurrence at or before the current time is the last occurrence. Convert to the local time
+        # zone and un-offset the current time to match the rule set's dates, the same as get_next_occurrence.
+        local_time = self.offset(self.convert_from_utc(current_time), reverse=True)
+        last_occurrence = self.get_rrule_set().before(local_time, inc=True)
+
+        # The params can be edited so the series starts after the current time. The due next occurrence is then the
+        # last occurrence, the same as update_next_occurrence.
+        if last_occurrence is None:
+            self.last_occurrence = self.next_occurrence
+        else:
+            self.last_occurrence = self.offset(self.convert_to_utc(last_occurrence))
+
+        # The first occurrence after the current time is the next occurrence
+        self.next_occurrence = self.get_next_occurrence(last_occurrence=current_time)
+
+        # Only save if the flag is true
+        if save:
+            self.save(update_fields=['last_occurrence', 'next_occurrence'])
+
     def convert_to_utc(self, dt):
         """
         Treats the datetime object as being in the timezone of self.timezone and then converts it to utc timezone.
         :type dt: datetime
         """
-        # Add timezone info
-        dt = fleming.attach_tz_if_none(dt, self.get_time_zone_object())
+        # Time zones with a fixed offset can skip localizing naive datetimes
+        utc_offset = self.get_fixed_utc_offset()
+        if utc_offset is not None and dt.tzinfo is None:
+            return dt - utc_offset
+
+        # Localizing naive datetimes searches the dst transitions so the results are cached
+        if dt.tzinfo is None:
+            return _localize_to_utc(self.get_time_zone_object(), dt)
+
+        # Convert to utc in a single pass. Converting to utc never needs normalizing.
+        return dt.astimezone(pytz.utc).replace(tzinfo=None)
+
+    def convert_from_utc(self, dt):
+        """
+        Treats the datetime object as being in utc and then converts it to a naive datetime in the timezone of
+        self.timezone.
+        :type dt: datetime
+        """
+        # Time zones with a fixed offset can skip localizing naive datetimes
+        utc_offset = self.get_fixed_utc_offset()
+        if utc_offset is not None and dt.tzinfo is None:
+            return dt + utc_offset
 
-        # Convert to utc
-        dt = fleming.convert_to_tz(dt, pytz.utc, return_naive=True)
+        # Naive datetimes are in utc
+        if dt.tzinfo is None:
+            dt = pytz.utc.localize(dt)
 
-        return dt
+        # astimezone applies the correct dst offset for pytz time zones so the result does not need normalizing
+        return dt.astimezone(self.get_time_zone_object()).replace(tzinfo=None)
 
     def offset(self, dt, reverse=False) -> datetime:
         """
@@ -314,15 +563,23 @@ class RRule(models.Model):
         :param reverse: Reverse the offset calculation.
         :return dt:
         """
+        if not self.day_offset:
+            return dt
+
         # The offset gets multiplied by 1 or -1 depending on offset direction
-        multiplier = -1 if reverse else 1
+        delta = timedelta(days=self.day_offset * (-1 if reverse else 1))
+
+        # Adding days to a naive utc date is the same in any time zone with a fixed offset, so the time zone
+        # round trip can be skipped.
+        if dt.tzinfo is None and (reverse or self.get_fixed_utc_offset() is not None):
+            return dt + delta
 
         # Timezone is considered when not reversing offset for comparisons in rrule.after().
         return fleming.add_timedelta(
             dt,
-            timedelta(days=self.day_offset * multiplier),
+            delta,
             within_tz=self.time_zone if not reverse else None
-        ) if self.day_offset else dt
+        )
 
     def refresh_next_occurrence(self, current_time=None):
         """
@@ -331,7 +588,8 @@ class RRule(models.Model):
         :param current_time: Optional datetime object to compute the next time from
         """
         # Get the current time or go off the specified current time
-        current_time = current_time or datetime.utcnow()
+        now = self.get_current_time()
+        current_time = current_time or now
 
         # Next occurrence is in utc here
         next_occurrence = self.get_next_occurrence(last_occurrence=current_time)
@@ -339,7 +597,7 @@ class RRule(models.Model):
         if next_occurrence:
             # Only set if the new time is still greater than now.
             # Offset date if applicable.
-            if next_occurrence > datetime.utcnow():
+            if next_occurrence > now:
                 self.next_occurrence = self.offset(next_occurrence)
         else:
             self.next_occurrence = next_occurrence
@@ -382,73 +640,92 @@ class RRule(models.Model):
         if is_new:
             # Convert next scheduled from utc back to time zone
             if params.get('dtstart') and not hasattr(params.get('dtstart'), 'date'):
-                params['dtstart'] = parser.parse(params['dtstart'])
+                params['dtstart'] = _parse_date(params['dtstart'])
 
             # Convert until date from utc back to time zone
             if params.get('until') and not hasattr(params.get('until'), 'date'):
-                params['until'] = parser.parse(params['until'])
+                params['until'] = _parse_date(params['until'])
 
-        # Serialize the datetime objects if they exist
+        # Serialize the datetime objects if they exist. isoformat matches the '%Y-%m-%d %H:%M:%S' format without
+        # parsing a format string on every call.
         if params.get('dtstart') and hasattr(params.get('dtstart'), 'date'):
-            params['dtstart'] = params['dtstart'].strftime('%Y-%m-%d %H:%M:%S')
+            params['dtstart'] = params['dtstart'].replace(tzinfo=None).isoformat(sep=' ', timespec='seconds')
 
         if params.get('until') and hasattr(params.get('until'), 'date'):
-            params['until'] = params['until'].strftime('%Y-%m-%d %H:%M:%S')
+            params['until'] = params['until'].replace(tzinfo=None).isoformat(sep=' ', timespec='seconds')
 
     def save(self, *args, **kwargs):
         """
         Saves the rrule model to the database. If this is a new object, the first next_scheduled time is
         determined and set. The `dtstart` and `until` objects will be safely encoded as strings if they are
-        datetime objects.
+        datetime objects. The params are left alone when update_fields is passed without them.
         """
 
-        # Run any pre save hooks
-        self.pre_save_hooks()
+        # Run any pre save hooks unless the params are not being saved
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or {'rrule_params', 'rrule_exclusion_params'} & set(update_fields):
+            self.pre_save_hooks()
 
         # Call the parent save method
         super().save(*args, **kwargs)
 
-    def get_dates(self, num_dates=20, start_date=None) -> List[datetime]:
+    def get_dates(self, num_dates=20, start_date=None, end_date=None) -> List[datetime]:
         """
-        Return a list of datetime objects the recurrence will generate, after the start date (if defined).
+        Return a list of datetime objects the recurrence will generate, after the start date (if defined) and up to
+        the end date (if defined).
         :param num_dates: The maximum number of dates to calculate. Will stop at passed start_date
         :param start_date: The optional start date to begin generating dates after
+        :param end_date: The optional end date to stop generating dates at, inclusive
         :return: A list of datetime objects
         """
 
         # Assert that we have dates
         assert num_dates > 0
 
+        # Generate the dates
+        return list(islice(self.iter_dates(start_date=start_date, end_date=end_date), num_dates))
+
+    def iter_dates(self, start_date=None, end_date=None) -> Iterator[datetime]:
+        """
+        Lazily yield the datetime objects the recurrence will generate, after the start date (if defined) and up to
+        the end date (if defined). Dates are only calculated as they are consumed so callers can stop early.
+        :param start_date: The optional start date to begin generating dates after
+        :param end_date: The optional end date to stop generating dates at, inclusive
+        :return: An iterator of datetime objects
+        """
+
         # Ensure that pre save hooks have been run
         self.pre_save_hooks()
 
-        # Generate the dates
-        dates = []
         try:
-            # Capture the rule's first date for use in RRule.after() in the loop.
+            # Build the rule set once and reuse it for every date in the window
             rule_set = self.get_rrule_set()
-
-            # Evaluate if the first date should be retained.
-            d = self.convert_to_utc(rule_set[0])
-            if not start_date or d > start_date:
-                dates.append(self.offset(d))
-
-            # Continue evaluating and appending dates to satisfy desired number,
-            # retaining date for evaluation in the next iteration.
-            # The offset is ignored for this comparison and applied at appending.
-            while len(dates) < num_dates:
-                d = self.get_next_occurrence(last_occurrence=d, calculate_offset=False)
-                if d:
-                    if not start_date or d > start_date:
-                        dates.append(self.offset(d))
-                else:
+            utc_offset = self.get_fixed_utc_offset()
+
+            if start_date:
+                # Start at the first date after the start date so earlier dates are not converted and discarded one
+                # at a time. dateutil still iterates them from dtstart inside after().
+                local_date = rule_set.after(self.convert_from_utc(start_date))
+            else:
+                local_date = rule_set[0]
+
+            # Continue evaluating and yielding dates until the series or the window ends.
+            # The offset is ignored for the date window comparisons and applied when yielding.
+            while local_date:
+                d = self.convert_to_utc(local_date)
+                if end_date and d > end_date:
                     break
+
+                yield self.offset(d)
+
+                # Step from the utc date converted back to local time so times skipped by dst are not repeated.
+                # Time zones with a fixed offset never skip times so they can step from the local date directly.
+                if utc_offset is None:
+                    local_date = self.convert_from_utc(d)
+                local_date = rule_set.after(local_date)
         except Exception:  # pragma: no cover
             pass
 
-        # Return the generated dates
-        return dates
-
     def generate_dates(self, num_dates=20):
         """
         DEPRECATED. Replaced by get_dates.
@@ -457,14 +734,26 @@ class RRule(models.Model):
         LOG.warning('generate_dates has been replaced by get_dates and will be removed in version 3.x.')
         return self.get_dates(num_dates)
 
-    def clone(self) -> RRule:
+    def copy_for_clone(self) -> RRule:
         """
-        Creates a clone of itself.
+        Returns an unsaved copy of this object. Only the json fields are deep copied so cached related objects are
+        shared instead of copied along with the rrule.
         """
+        clone = copy.copy(self)
+        clone.rrule_params = copy.deepcopy(self.rrule_params)
+        clone.rrule_exclusion_params = copy.deepcopy(self.rrule_exclusion_params)
+        clone.meta_data = copy.deepcopy(self.meta_data)
 
         # Clear id to force a new object.
-        clone = copy.deepcopy(self)
         clone.id = None
+        return clone
+
+    def clone(self) -> RRule:
+        """
+        Creates a clone of itself.
+        """
+
+        clone = self.copy_for_clone()
         clone.save()
         return clone
 
@@ -475,19 +764,26 @@ class RRule(models.Model):
         The clone's next_occurrence is set to the offset of this object.
         :param day_offset: The number of days to offset the clone's start date. Can be negative.
         """
-        clone = copy.deepcopy(self)
-        clone.id = None
+        clone = self.copy_for_clone()
         clone.day_offset = day_offset
         clone.next_occurrence = clone.offset(clone.next_occurrence)
         clone.save()
         return clone
 
     @classmethod
-    def get_dates_from_params(cls, rrule_params, time_zone=None, num_dates=20, start_date=None):
+    def get_dates_from_params(cls, rrule_params, time_zone=None, num_dates=20, start_date=None, end_date=None):
+        """
+        Returns the dates generated by a set of rrule params. Results are cached for identical arguments when
+        num_dates is at most _MAX_CACHED_NUM_DATES. Larger requests are generated every time, which trades repeated
+        work for not keeping up to 512 long lists of dates in memory.
+        """
         time_zone = time_zone or pytz.utc
-        rule = cls(rrule_params=rrule_params, time_zone=time_zone)
 
-        return rule.get_dates(num_dates=num_dates, start_date=start_date)
+        if num_dates > _MAX_CACHED_NUM_DATES:
+            rule = cls(rrule_params=copy.deepcopy(rrule_params), time_zone=time_zone)
+            return rule.get_dates(num_dates=num_dates, start_date=start_date, end_date=end_date)
+
+        return list(_get_dates_from_params(cls, _freeze(rrule_params), time_zone, num_dates, start_date, end_date))
 
     @classmethod
     def generate_dates_from_params(cls, rrule_params, time_zone=None, num_dates=20):
@@ -3,14 +3,17 @@ import fleming
 
 import pytz
 from dateutil import rrule, parser
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django_dynamic_fixture import G
 from freezegun import freeze_time
+from unittest.mock import patch
 
 from ambition_utils.rrule.constants import RecurrenceEnds
 from ambition_utils.rrule.forms import RecurrenceForm
 from ambition_utils.rrule.handler import OccurrenceHandler
-from ambition_utils.rrule.models import RRule
+from ambition_utils.rrule.models import RRule, _MAX_CACHED_NUM_DATES, _parse_date, _parse_rrule_params
 from ambition_utils.rrule.tests.models import Program
 
 
@@ -28,7 +31,7 @@ class HandlerOne(OccurrenceHandler):
     def handle(self):
         return RRule.objects.filter(
             occurrence_handler_path='ambition_utils.rrule.tests.model_tests.HandlerOne',
-            next_occurrence__lte=datetime.datetime.utcnow(),
+            next_occurrence__lte=RRule.get_current_time(),
         ).order_by('id')
 
 
@@ -37,7 +40,7 @@ class HandlerTwo(OccurrenceHandler):
     def handle(self):
         return RRule.objects.filter(
             occurrence_handler_path='ambition_utils.rrule.tests.model_tests.HandlerTwo',
-            next_occurrence__lte=datetime.datetime.utcnow(),
+            next_occurrence__lte=RRule.get_current_time(),
         ).order_by('id')
 
 
@@ -46,7 +49,7 @@ class HandlerThree(OccurrenceHandler):
     def handle(self):
         return RRule.objects.filter(
             occurrence_handler_path='ambition_utils.rrule.tests.model_tests.HandlerThree',
-            next_occurrence__lte=datetime.datetime.utcnow(),
+            next_occurrence__lte=RRule.get_current_time(),
         ).order_by('id')
 
 
@@ -117,8 +120,9 @@ class RRuleManagerTest(TestCase):
         self.assertEqual(rrule2.next_occurrence, datetime.datetime(2017, 1, 3))
 
         # Make sure neither are progressed with passing an empty list
-        with freeze_time('1-5-2017'):
-            RRule.objects.update_next_occurrences(rrule_objects=[])
+        with freeze_time('1-5-2017'), CaptureQueriesContext(connection) as context:
+            self.assertEqual(RRule.objects.update_next_occurrences(rrule_objects=[]), [])
+        self.assertEqual(len(context.captured_queries), 0)
 
         rrule1.refresh_from_db()
         rrule2.refresh_from_db()
@@ -127,6 +131,81 @@ class RRuleManagerTest(TestCase):
         self.assertEqual(rrule1.next_occurrence, datetime.datetime(2017, 1, 4))
         self.assertEqual(rrule2.next_occurrence, datetime.datetime(2017, 1, 3))
 
+    def test_update_next_occurrences_queryset(self):
+        """
+        A queryset of rrules should be advanced and saved
+        """
+        params = {
+            'freq': rrule.DAILY,
+            'interval': 1,
+            'dtstart': datetime.datetime(2017, 1, 2),
+        }
+
+        rrule1 = G(
+            RRule,
+            rrule_params=params,
+            occurrence_handler_path='ambition_utils.rrule.tests.model_tests.HandlerOne'
+        )
+        rrule2 = G(
+            RRule,
+            rrule_params=dict(params),
+            occurrence_handler_path='ambition_utils.rrule.tests.model_tests.HandlerTwo'
+        )
+
+        with freeze_time('1-3-2017'):
+            rrule_objects = RRule.objects.update_next_occurrences(
+                RRule.objects.filter(occurrence_handler_path='ambition_utils.rrule.tests.model_tests.HandlerOne')
+            )
+
+        self.assertEqual([rrule_object.id for rrule_object in rrule_objects], [rrule1.id])
+
+        rrule1.refresh_from_db()
+        rrule2.refresh_from_db()
+
+        # Only the first rule should be progressed
+        self.assertEqual(rrule1.last_occurrence, datetime.datetime(2017, 1, 2))
+        self.assertEqual(rrule1.next_occurrence, datetime.datetime(2017, 1, 3))
+        self.assertEqual(rrule2.next_occurrence, datetime.datetime(2017, 1, 2))
+
+        # Querysets that already choose their fields or relations are loaded as given
+        with freeze_time('1-4-2017'):
+            rrule_objects = RRule.objects.update_next_occurrences(
+                RRule.objects.filter(id=rrule1.id).select_related('related_object_content_type')
+            )
+            self.assertEqual(rrule_objects[0].get_deferred_fields(), set())
+
+            rrule_objects = RRule.objects.update_next_occurrences(
+                RRule.objects.filter(id=rrule2.id).defer('meta_data')
+            )
+            self.assertEqual(rrule_objects[0].get_deferred_fields(), {'meta_data'})
+
+        rrule1.refresh_from_db()
+        rrule2.refresh_from_db()
+        self.assertEqual(rrule1.last_occurrence, datetime.datetime(2017, 1, 3))
+        self.assertEqual(rrule1.next_occurrence, datetime.datetime(2017, 1, 4))
+        self.assertEqual(rrule2.last_occurrence, datetime.datetime(2017, 1, 2))
+        self.assertEqual(rrule2.next_occurrence, datetime.datetime(2017, 1, 3))
+
+        # Prefetching querysets keep every field loaded and evaluated querysets advance the caller's instances
+        with freeze_time('1-5-2017'):
+            rrule_objects = RRule.objects.update_next_occurrences(
+                RRule.objects.filter(id=rrule1.id).prefetch_related('related_object')
+            )
+            self.assertEqual(rrule_objects[0].get_deferred_fields(), set())
+
+            queryset = RRule.objects.filter(id=rrule2.id)
+            instances = list(queryset)
+            rrule_objects = RRule.objects.update_next_occurrences(queryset)
+            self.assertIs(rrule_objects[0], instances[0])
+            self.assertEqual(instances[0].next_occurrence, datetime.datetime(2017, 1, 4))
+
+        rrule1.refresh_from_db()
+        rrule2.refresh_from_db()
+        self.assertEqual(rrule1.last_occurrence, datetime.datetime(2017, 1, 4))
+        self.assertEqual(rrule1.next_occurrence, datetime.datetime(2017, 1, 5))
+        self.assertEqual(rrule2.last_occurrence, datetime.datetime(2017, 1, 3))
+        self.assertEqual(rrule2.next_occurrence, datetime.datetime(2017, 1, 4))
+
     @freeze_time('1-1-2017')
     def test_run(self):
         """
@@ -185,11 +264,14 @@ class RRuleManagerTest(TestCase):
             occurrence_handler_path='ambition_utils.rrule.tests.model_tests.HandlerThree'
         )
 
-        # Get and verify the classes
-        classes = {
-            instance.__class__
-            for instance in RRule.objects.overdue_handler_class_instances()
-        }
+        # Get and verify the classes. The rrule params should not be loaded to find the handlers.
+        with CaptureQueriesContext(connection) as context:
+            classes = {
+                instance.__class__
+                for instance in RRule.objects.overdue_handler_class_instances()
+            }
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertNotIn('rrule_params', context.captured_queries[0]['sql'])
 
         self.assertEqual(classes, {HandlerOne, HandlerTwo})
 
@@ -249,9 +331,19 @@ class RRuleTest(TestCase):
             self.assertEqual(program.start_recurrence.next_occurrence, datetime.datetime(2022, 6, 1, 9))
             self.assertEqual(program.end_recurrence.next_occurrence, datetime.datetime(2022, 6, 1, 17))
 
-        # Make sure only start handler is called
+        # Make sure only start handler is called. The overdue rrules should be locked and rrules locked by other
+        # workers skipped.
         with freeze_time(datetime.datetime(2022, 6, 1, 9)):
-            RRule.objects.handle_overdue()
+            with CaptureQueriesContext(connection) as context:
+                RRule.objects.handle_overdue()
+            overdue_queries = [
+                query['sql']
+                for query in context.captured_queries
+                if '"related_object_handler_name" IS NOT NULL' in query['sql']
+            ]
+            self.assertEqual(len(overdue_queries), 1)
+            self.assertIn('FOR UPDATE SKIP LOCKED', overdue_queries[0])
+
             program = Program.objects.get(id=program.id)
             self.assertEqual(program.start_called, 1)
             self.assertEqual(program.end_called, 0)
@@ -329,6 +421,94 @@ class RRuleTest(TestCase):
         rrule.time_zone = pytz.utc
         self.assertEqual(rrule.get_time_zone_object(), pytz.utc)
 
+    def test_get_occurrence_handler_class_instance(self):
+        """
+        The handler class should only be imported once and invalid paths should not return an instance
+        """
+        rule = RRule(occurrence_handler_path='ambition_utils.rrule.tests.model_tests.HandlerOne')
+        self.assertIsInstance(rule.get_occurrence_handler_class_instance(), HandlerOne)
+
+        with patch('ambition_utils.rrule.models.import_string') as mock_import_string:
+            self.assertIsInstance(rule.get_occurrence_handler_class_instance(), HandlerOne)
+            mock_import_string.assert_not_called()
+
+        rule.occurrence_handler_path = 'ambition_utils.rrule.tests.model_tests.FakeHandler'
+        self.assertIsNone(rule.get_occurrence_handler_class_instance())
+
+    def test_get_fixed_utc_offset(self):
+        """
+        Time zones without dst should have a fixed offset that is used for converting dates
+        """
+        self.assertEqual(RRule().get_fixed_utc_offset(), datetime.timedelta(0))
+        self.assertIsNone(RRule(time_zone=pytz.timezone('US/Eastern')).get_fixed_utc_offset())
+
+        rule = RRule(time_zone=pytz.timezone('Etc/GMT+5'))
+        self.assertEqual(rule.get_fixed_utc_offset(), datetime.timedelta(hours=-5))
+        self.assertEqual(rule.convert_to_utc(datetime.datetime(2017, 1, 1, 10)), datetime.datetime(2017, 1, 1, 15))
+        self.assertEqual(rule.convert_from_utc(datetime.datetime(2017, 1, 1, 15)), datetime.datetime(2017, 1, 1, 10))
+
+        # Aware datetimes are still converted
+        self.assertEqual(
+            rule.convert_to_utc(pytz.utc.localize(datetime.datetime(2017, 1, 1, 10))),
+            datetime.datetime(2017, 1, 1, 10)
+        )
+        self.assertEqual(
+            rule.convert_from_utc(pytz.utc.localize(datetime.datetime(2017, 1, 1, 15))),
+            datetime.datetime(2017, 1, 1, 10)
+        )
+
+    def test_convert_dst(self):
+        """
+        Dates in time zones with dst should convert with the offset in effect on that date
+        """
+        rule = RRule(time_zone=pytz.timezone('US/Eastern'))
+        self.assertEqual(rule.convert_to_utc(datetime.datetime(2017, 1, 1, 10)), datetime.datetime(2017, 1, 1, 15))
+        self.assertEqual(rule.convert_to_utc(datetime.datetime(2017, 7, 1, 10)), datetime.datetime(2017, 7, 1, 14))
+        self.assertEqual(rule.convert_from_utc(datetime.datetime(2017, 1, 1, 15)), datetime.datetime(2017, 1, 1, 10))
+        self.assertEqual(rule.convert_from_utc(datetime.datetime(2017, 7, 1, 14)), datetime.datetime(2017, 7, 1, 10))
+
+        # Aware datetimes keep their own time zone
+        self.assertEqual(
+            rule.convert_to_utc(pytz.utc.localize(datetime.datetime(2017, 7, 1, 10))),
+            datetime.datetime(2017, 7, 1, 10)
+        )
+
+        # Repeated conversions are cached
+        with patch.object(type(rule.time_zone), 'localize') as mock_localize:
+            self.assertEqual(
+                rule.convert_to_utc(datetime.datetime(2017, 7, 1, 10)),
+                datetime.datetime(2017, 7, 1, 14)
+            )
+            mock_localize.assert_not_called()
+
+    def test_get_rrule_cached(self):
+        """
+        Rules with identical params should share parsed params but never an rrule object, and changing the params
+        should build a new rule
+        """
+        params = {
+            'freq': rrule.WEEKLY,
+            'interval': 1,
+            'dtstart': datetime.datetime(2017, 1, 2),
+            'byweekday': [0, 2, 4],
+        }
+        rule = RRule(rrule_params=params)
+        other_rule = RRule(rrule_params=dict(params))
+
+        rule.get_rrule()
+        hits = _parse_rrule_params.cache_info().hits
+        self.assertIsNot(rule.get_rrule(), other_rule.get_rrule())
+        self.assertEqual(_parse_rrule_params.cache_info().hits, hits + 2)
+        self.assertEqual(list(rule.get_rrule()[:4]), list(other_rule.get_rrule()[:4]))
+        self.assertIsNot(rule.get_rrule_set(), other_rule.get_rrule_set())
+        self.assertEqual(list(rule.get_rrule_set()[:4]), list(other_rule.get_rrule_set()[:4]))
+        self.assertIsNone(rule.get_rrule_exclusion())
+
+        # Modify the params and make sure the rule is rebuilt
+        rule.rrule_params['interval'] = 2
+        self.assertEqual(rule.get_rrule()[3], datetime.datetime(2017, 1, 16))
+        self.assertEqual(other_rule.get_rrule()[3], datetime.datetime(2017, 1, 9))
+
     def test_get_next_occurrence_first_is_occurrence(self):
         """
         First occurrence should be the dtstart
@@ -796,6 +976,99 @@ class RRuleTest(TestCase):
         self.assertEqual(next_dates[4], datetime.datetime(2017, 1, 9, 5))
         self.assertEqual(next_dates[5], datetime.datetime(2017, 1, 10, 5))
 
+    def test_get_dates_with_end_date(self):
+        """
+        Dates should stop at the end date, inclusive, even when num_dates has not been reached.
+        """
+        params = {
+            'freq': rrule.DAILY,
+            'interval': 1,
+            'dtstart': datetime.datetime(2017, 1, 1),
+        }
+
+        rule = RRule(
+            rrule_params=params,
+            time_zone=pytz.timezone('US/Eastern'),
+            occurrence_handler_path='ambition_utils.rrule.tests.model_tests.MockHandler'
+        )
+        next_dates = rule.get_dates(
+            num_dates=20,
+            start_date=datetime.datetime(2017, 1, 5),
+            end_date=datetime.datetime(2017, 1, 7, 5),
+        )
+
+        self.assertEqual(
+            next_dates,
+            [
+                datetime.datetime(2017, 1, 5, 5),
+                datetime.datetime(2017, 1, 6, 5),
+                datetime.datetime(2017, 1, 7, 5),
+            ]
+        )
+
+        # The class method wrapper should produce the same dates
+        self.assertEqual(
+            RRule.get_dates_from_params(
+                rrule_params=params,
+                time_zone=pytz.timezone('US/Eastern'),
+                start_date=datetime.datetime(2017, 1, 5),
+                end_date=datetime.datetime(2017, 1, 7, 5),
+            ),
+            next_dates
+        )
+
+        # A start date after the end of the series should not return any dates
+        params['until'] = datetime.datetime(2017, 1, 3)
+        self.assertEqual(
+            RRule.get_dates_from_params(rrule_params=params, start_date=datetime.datetime(2017, 1, 5)),
+            []
+        )
+
+    def test_iter_dates(self):
+        """
+        Dates should be generated lazily so an unbounded series can be consumed until the caller stops
+        """
+        rule = RRule(
+            rrule_params={
+                'freq': rrule.DAILY,
+                'dtstart': datetime.datetime(2017, 1, 1),
+            },
+            time_zone=pytz.timezone('US/Eastern'),
+            occurrence_handler_path='ambition_utils.rrule.tests.model_tests.MockHandler'
+        )
+
+        dates = rule.iter_dates(start_date=datetime.datetime(2017, 1, 5))
+        self.assertEqual(next(dates), datetime.datetime(2017, 1, 5, 5))
+        self.assertEqual(next(dates), datetime.datetime(2017, 1, 6, 5))
+
+        self.assertEqual(
+            list(rule.iter_dates(end_date=datetime.datetime(2017, 1, 2, 5))),
+            [datetime.datetime(2017, 1, 1, 5), datetime.datetime(2017, 1, 2, 5)]
+        )
+
+    def test_get_dates_dst_gap(self):
+        """
+        Hours skipped by a dst change should not produce duplicate utc dates.
+        US/Eastern skips from 2am to 3am on 3/12/17.
+        """
+        rule = RRule(
+            rrule_params={
+                'freq': rrule.HOURLY,
+                'dtstart': datetime.datetime(2017, 3, 12),
+            },
+            time_zone=pytz.timezone('US/Eastern'),
+        )
+
+        self.assertEqual(
+            rule.get_dates(num_dates=4),
+            [
+                datetime.datetime(2017, 3, 12, 5),
+                datetime.datetime(2017, 3, 12, 6),
+                datetime.datetime(2017, 3, 12, 7),
+                datetime.datetime(2017, 3, 12, 8),
+            ]
+        )
+
     def test_generate_dates_from_params(self):
         """
         Assert generate_dates_from_params returns the same values as get_dates_from_params.
@@ -848,6 +1121,57 @@ class RRuleTest(TestCase):
 
         self.assertEqual(next_dates, next_dates_from_params)
 
+    def test_get_dates_from_params_cached(self):
+        """
+        Identical calls should reuse the generated dates and changing the returned list should not affect the cache
+        """
+        params = {
+            'freq': rrule.WEEKLY,
+            'interval': 3,
+            'dtstart': datetime.datetime(2017, 1, 2),
+            'byweekday': [1, 3],
+        }
+
+        next_dates = RRule.get_dates_from_params(rrule_params=params, num_dates=3)
+        self.assertEqual(
+            next_dates,
+            [
+                datetime.datetime(2017, 1, 3),
+                datetime.datetime(2017, 1, 5),
+                datetime.datetime(2017, 1, 24),
+            ]
+        )
+        next_dates.pop()
+
+        with patch.object(RRule, 'get_dates') as mock_get_dates:
+            self.assertEqual(
+                RRule.get_dates_from_params(rrule_params=params, num_dates=3),
+                [
+                    datetime.datetime(2017, 1, 3),
+                    datetime.datetime(2017, 1, 5),
+                    datetime.datetime(2017, 1, 24),
+                ]
+            )
+            mock_get_dates.assert_not_called()
+
+    def test_get_dates_from_params_large_num_dates_not_cached(self):
+        """
+        Requests for more dates than the cache limit should be generated every time without changing the params
+        """
+        params = {
+            'freq': rrule.DAILY,
+            'dtstart': datetime.datetime(2017, 1, 2),
+        }
+
+        next_dates = RRule.get_dates_from_params(rrule_params=params, num_dates=_MAX_CACHED_NUM_DATES + 1)
+        self.assertEqual(len(next_dates), _MAX_CACHED_NUM_DATES + 1)
+        self.assertEqual(next_dates[0], datetime.datetime(2017, 1, 2))
+        self.assertEqual(params['dtstart'], datetime.datetime(2017, 1, 2))
+
+        with patch.object(RRule, 'get_dates', return_value=[]) as mock_get_dates:
+            RRule.get_dates_from_params(rrule_params=params, num_dates=_MAX_CACHED_NUM_DATES + 1)
+            mock_get_dates.assert_called_once()
+
     def test_model_different_time_zone_end_of_month_get_dates(self):
         """
         Test a monthly first day of month rule to catch case of converting tz back using the get_dates method
@@ -990,6 +1314,30 @@ class RRuleTest(TestCase):
         self.assertEqual(rule.last_occurrence, datetime.datetime(2017, 1, 3))
         self.assertEqual(rule.next_occurrence, None)
 
+    def test_get_next_occurrence_until_passed(self):
+        """
+        Makes sure the rule set is not built once the last occurrence reaches until unless forced
+        """
+        rule = RRule.objects.create(
+            rrule_params={
+                'freq': rrule.DAILY,
+                'dtstart': datetime.datetime(2017, 1, 1),
+                'until': datetime.datetime(2017, 1, 3),
+            },
+            occurrence_handler_path='ambition_utils.rrule.tests.model_tests.MockHandler'
+        )
+
+        self.assertEqual(rule.get_next_occurrence(datetime.datetime(2017, 1, 2)), datetime.datetime(2017, 1, 3))
+
+        with patch.object(RRule, 'get_rrule_set') as mock_get_rrule_set:
+            self.assertIsNone(rule.get_next_occurrence(datetime.datetime(2017, 1, 3)))
+            mock_get_rrule_set.assert_not_called()
+
+        self.assertEqual(
+            rule.get_next_occurrence(datetime.datetime(2017, 1, 3), force=True),
+            datetime.datetime(2017, 1, 4)
+        )
+
     @freeze_time('1-1-2016')
     def test_update_next_occurrence_ignore(self):
         """
@@ -1008,11 +1356,115 @@ class RRuleTest(TestCase):
         self.assertEqual(rule.last_occurrence, None)
         self.assertEqual(rule.next_occurrence, datetime.datetime(2017, 1, 1))
 
-        # Handle the next occurrence
-        rule.update_next_occurrence()
+        # Handle the next occurrence. The rrule should not be built or saved when the occurrence is not due
+        with patch.object(RRule, 'get_rrule_set') as mock_get_rrule_set, patch.object(RRule, 'save') as mock_save:
+            self.assertFalse(rule.update_next_occurrence())
+            mock_get_rrule_set.assert_not_called()
+            mock_save.assert_not_called()
+
         self.assertEqual(rule.last_occurrence, None)
         self.assertEqual(rule.next_occurrence, datetime.datetime(2017, 1, 1))
 
+    def test_advance_to(self):
+        """
+        Verifies all missed occurrences are skipped with a single save
+        """
+        rule = RRule.objects.create(
+            rrule_params={
+                'freq': rrule.DAILY,
+                'dtstart': datetime.datetime(2017, 1, 1),
+                'count': 5,
+            },
+            occurrence_handler_path='ambition_utils.rrule.tests.model_tests.MockHandler'
+        )
+
+        # Nothing is saved when the next occurrence is not due
+        with CaptureQueriesContext(connection) as context:
+            self.assertFalse(rule.advance_to(current_time=datetime.datetime(2016, 12, 31)))
+        self.assertEqual(len(context.captured_queries), 0)
+
+        with CaptureQueriesContext(connection) as context:
+            rule.advance_to(current_time=datetime.datetime(2017, 1, 3, 12))
+        self.assertEqual(len(context.captured_queries), 1)
+
+        rule.refresh_from_db()
+        self.assertEqual(rule.last_occurrence, datetime.datetime(2017, 1, 3))
+        self.assertEqual(rule.next_occurrence, datetime.datetime(2017, 1, 4))
+
+        # Advancing past the end of the series ends it
+        with patch.object(RRule, 'get_current_time', return_value=datetime.datetime(2017, 2, 1)):
+            rule.advance_to(save=False)
+        self.assertEqual(rule.last_occurrence, datetime.datetime(2017, 1, 5))
+        self.assertIsNone(rule.next_occurrence)
+
+        # Nothing is saved once the series has ended
+        with CaptureQueriesContext(connection) as context:
+            self.assertIsNone(rule.advance_to(current_time=datetime.datetime(2017, 3, 1)))
+        self.assertEqual(len(context.captured_queries), 0)
+
+    def test_advance_to_time_zone_offset(self):
+        """
+        Verifies advancing converts to the local time zone and applies the day offset
+        """
+        rule = RRule.objects.create(
+            rrule_params={
+                'freq': rrule.DAILY,
+                'dtstart': datetime.datetime(2017, 1, 1, 9),
+            },
+            time_zone=pytz.timezone('US/Eastern'),
+            day_offset=1,
+            occurrence_handler_path='ambition_utils.rrule.tests.model_tests.MockHandler'
+        )
+        self.assertEqual(rule.next_occurrence, datetime.datetime(2017, 1, 2, 14))
+
+        rule.advance_to(save=False, current_time=datetime.datetime(2017, 1, 5, 15))
+        self.assertEqual(rule.last_occurrence, datetime.datetime(2017, 1, 5, 14))
+        self.assertEqual(rule.next_occurrence, datetime.datetime(2017, 1, 6, 14))
+
+    def test_advance_to_no_occurrence_before_current_time(self):
+        """
+        Verifies the due next occurrence becomes the last occurrence when the params were changed to start later
+        """
+        rule = RRule.objects.create(
+            rrule_params={
+                'freq': rrule.DAILY,
+                'dtstart': datetime.datetime(2017, 1, 1),
+            },
+            occurrence_handler_path='ambition_utils.rrule.tests.model_tests.MockHandler'
+        )
+        self.assertEqual(rule.next_occurrence, datetime.datetime(2017, 1, 1))
+
+        rule.rrule_params['dtstart'] = datetime.datetime(2017, 1, 10)
+        rule.advance_to(save=False, current_time=datetime.datetime(2017, 1, 5))
+        self.assertEqual(rule.last_occurrence, datetime.datetime(2017, 1, 1))
+        self.assertEqual(rule.next_occurrence, datetime.datetime(2017, 1, 10))
+
+    def test_get_current_time(self):
+        """
+        Verifies the next occurrence is checked and advanced against get_current_time
+        """
+        params = {
+            'freq': rrule.DAILY,
+            'dtstart': datetime.datetime(2017, 1, 1),
+        }
+
+        rule = RRule.objects.create(
+            rrule_params=params,
+            occurrence_handler_path='ambition_utils.rrule.tests.model_tests.MockHandler'
+        )
+
+        with patch.object(RRule, 'get_current_time', return_value=datetime.datetime(2017, 1, 1, 12)):
+            rule.update_next_occurrence()
+
+        self.assertEqual(rule.last_occurrence, datetime.datetime(2017, 1, 1))
+        self.assertEqual(rule.next_occurrence, datetime.datetime(2017, 1, 2))
+
+        # A passed current time is used instead
+        self.assertFalse(rule.update_next_occurrence(current_time=datetime.datetime(2017, 1, 1, 12)))
+        rule.update_next_occurrence(current_time=datetime.datetime(2017, 1, 2))
+        self.assertEqual(rule.last_occurrence, datetime.datetime(2017, 1, 2))
+        self.assertEqual(rule.next_occurrence, datetime.datetime(2017, 1, 3))
+
     @freeze_time('1-1-2018')
     def test_update_next_occurrence(self):
         """
@@ -1031,8 +1483,17 @@ class RRuleTest(TestCase):
         self.assertEqual(rule.last_occurrence, None)
         self.assertEqual(rule.next_occurrence, datetime.datetime(2017, 1, 1))
 
-        # Handle the next occurrence
-        rule.update_next_occurrence()
+        # Handle the next occurrence. Only the occurrence fields should be written in a single update
+        with CaptureQueriesContext(connection) as queries:
+            rule.update_next_occurrence()
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('rrule_params', queries[0]['sql'])
+
+        self.assertEqual(rule.last_occurrence, datetime.datetime(2017, 1, 1))
+        self.assertEqual(rule.next_occurrence, datetime.datetime(2017, 1, 2))
+
+        # Make sure the update was saved
+        rule.refresh_from_db()
         self.assertEqual(rule.last_occurrence, datetime.datetime(2017, 1, 1))
         self.assertEqual(rule.next_occurrence, datetime.datetime(2017, 1, 2))
 
@@ -1161,6 +1622,33 @@ class RRuleTest(TestCase):
         self.assertEqual(rule.rrule_params['dtstart'], '2019-05-01 00:00:00')
         self.assertEqual(rule.rrule_params['until'], '2019-06-01 00:00:00')
 
+    def test_parse_date(self):
+        """
+        Verifies stored iso dates and other date formats are both parsed
+        """
+        self.assertEqual(_parse_date('2019-05-01 00:00:00'), datetime.datetime(2019, 5, 1))
+        self.assertEqual(_parse_date('2019-05-01T10:30:00'), datetime.datetime(2019, 5, 1, 10, 30))
+        self.assertEqual(_parse_date('May 1 2019 10:30'), datetime.datetime(2019, 5, 1, 10, 30))
+
+    def test_save_update_fields(self):
+        """
+        Verifies the params are only serialized when they are part of the saved fields
+        """
+        rule = RRule.objects.create(
+            rrule_params={
+                'freq': rrule.DAILY,
+                'dtstart': datetime.datetime(2019, 5, 1),
+            },
+            occurrence_handler_path='ambition_utils.rrule.tests.model_tests.MockHandler',
+        )
+
+        with patch.object(RRule, 'pre_save_hooks') as mock_pre_save_hooks:
+            rule.save(update_fields=['last_occurrence', 'next_occurrence'])
+            mock_pre_save_hooks.assert_not_called()
+
+            rule.save(update_fields=['rrule_params'])
+            mock_pre_save_hooks.assert_called_once_with()
+
     @freeze_time('6-15-2022')
     def test_clone(self):
         # New object that starts next Wednesday
@@ -1187,6 +1675,12 @@ class RRuleTest(TestCase):
         # Assert the generated dates are equal.
         self.assertEqual(rule.get_dates(num_dates=4), clone.get_dates(num_dates=4))
 
+        # Assert the clone does not share params with the original
+        clone.rrule_params['byweekday'].append(6)
+        clone.meta_data['key'] = 'value'
+        self.assertEqual(rule.rrule_params['byweekday'], [0, 2, 4])
+        self.assertEqual(rule.meta_data, {})
+
     @freeze_time('6-15-2022')
     def test_weekly_clone_with_offset(self):
         # New object that starts next Wednesday
@@ -1248,6 +1742,27 @@ class RRuleTest(TestCase):
             ]
         )
 
+    def test_clone_with_day_offset_reuses_parsed_params(self):
+        """
+        Cloning with an offset keeps the same params so the parsed params should be reused rather than parsed again
+        """
+        rule = RRule.objects.create(
+            rrule_params={
+                'freq': rrule.WEEKLY,
+                'dtstart': datetime.datetime(2022, 6, 21),
+                'byweekday': [0, 2, 4],
+            },
+            occurrence_handler_path='ambition_utils.rrule.tests.model_tests.MockHandler'
+        )
+        rule.get_rrule_set()
+        misses = _parse_rrule_params.cache_info().misses
+
+        clone = rule.clone_with_day_offset(2)
+        clone.get_rrule_set()
+
+        self.assertEqual(_parse_rrule_params.cache_info().misses, misses)
+        self.assertEqual(clone.next_occurrence, datetime.datetime(2022, 6, 24))
+
     @freeze_time('6-1-2022')
     def test_monthly_clone_with_offset(self):
         """
@@ -1502,6 +2017,20 @@ class RRuleTest(TestCase):
             datetime.datetime(2023, 1, 1)
         )
 
+        # Reversing ignores the time zone
+        self.assertEqual(
+            RRule(day_offset=1, time_zone=pytz.timezone('US/Eastern')).offset(
+                datetime.datetime(2023, 3, 13), reverse=True
+            ),
+            datetime.datetime(2023, 3, 12)
+        )
+
+        # Offsetting across dst keeps the local time
+        self.assertEqual(
+            RRule(day_offset=1, time_zone=pytz.timezone('US/Eastern')).offset(datetime.datetime(2023, 3, 12, 5)),
+            datetime.datetime(2023, 3, 13, 4)
+        )
+
     def test_day_offset(self):
         """
         Assert that the field, day_offset, adjusts all generated dates.
@@ -46,6 +46,17 @@ class TimeZoneFieldTest(TestCase):
         instance.refresh_from_db()
         self.assertEqual(instance.no_cast_time_zone_field, pytz.timezone('US/Eastern'))
 
+    def test_default_pytz_tzs(self):
+        """
+        Verifies the default time zones are all pytz time zones and are reused from the class
+        """
+        default_tzs = TimeZoneField.get_default_pytz_tzs()
+        self.assertEqual(default_tzs, [pytz.timezone(tz) for tz in pytz.all_timezones])
+
+        # Modifying the returned list should not change the class level time zones
+        default_tzs.pop()
+        self.assertEqual(len(TimeZoneField.get_default_pytz_tzs()), len(pytz.all_timezones))
+
     def test_all_time_zones_choices(self):
         """
         Verifies that all time zones are available in a method for usage in form choices